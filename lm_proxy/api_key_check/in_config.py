@@ -7,20 +7,24 @@ set "api_key_check" configuration value to "lm_proxy.api_key_check.check_api_key
 """
 
 from typing import Optional
-from ..bootstrap import env
+from ..bootstrap import env, hash_api_key
 
 
 def check_api_key_in_config(api_key: Optional[str]) -> Optional[str]:
     """
     Validates a Client API key against configured groups and returns the matching group name.
 
+    Uses the reverse hashed-key --> group_name index precomputed at bootstrap:
+    each check hashes the presented key with the per-process pepper and does a
+    single dictionary lookup on fixed-size digests, so comparison cost does not
+    depend on how much of the key matches.
+
     Args:
         api_key (Optional[str]): The Virtual / Client API key to validate.
     Returns:
         Optional[str]: The group name if the API key is valid and found in a group,
         None otherwise.
     """
-    for group_name, group in env.config.groups.items():
-        if api_key in group.api_keys:
-            return group_name
-    return None
+    if not api_key:
+        return None
+    return env.api_key_index.get(hash_api_key(api_key))
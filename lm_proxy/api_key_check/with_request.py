@@ -2,17 +2,29 @@
 API key check implementation using HTTP requests.
 """
 
+import asyncio
+import hashlib
+import random
+import time
 from typing import Optional
 from dataclasses import dataclass, field
-import requests
+
+import httpx
 
 from ..config import TApiKeyCheckFunc
 
+_RETRY = object()
+""" Sentinel resolved into an in-flight future when its leading call is
+cancelled: tells deduplicated waiters to retry rather than fail. """
+
 
 @dataclass(slots=True)
 class CheckAPIKeyWithRequest:  # pylint: disable=too-many-instance-attributes
     """
-    Validates a Client API key by making an HTTP request to a specified URL.
+    Validates a Client API key by making an asynchronous HTTP request to a specified URL.
+
+    Validation requests share a pooled httpx.AsyncClient with keep-alive connections,
+    so concurrent checks don't block the event loop and reuse TCP/TLS sessions.
     """
 
     url: str = field()
@@ -31,49 +43,131 @@ class CheckAPIKeyWithRequest:  # pylint: disable=too-many-instance-attributes
     use_cache: bool = field(default=False)
     """
     Whether to cache the results of API key checks.
-    Requires 'cachetools' package if set to True.
     """
     cache_size: int = field(default=1024 * 16)
     cache_ttl: int = field(default=60 * 5)  # 5 minutes
+    negative_ttl: int = field(default=30)  # seconds
+    """
+    TTL for caching failed checks (invalid / rejected keys).
+    """
+    ttl_jitter: float = field(default=0.1)
+    """
+    Relative TTL randomization (+/-) to avoid expiry stampedes.
+    """
     timeout: int = field(default=5)  # seconds
+    _client: httpx.AsyncClient = field(init=False, repr=False)
     _func: TApiKeyCheckFunc = field(init=False, repr=False)
+    _url_parts: list[str] = field(init=False, repr=False)
+    _header_parts: list[tuple[str, list[str]]] = field(init=False, repr=False)
 
     def __post_init__(self):
-        def check_func(api_key: str) -> Optional[tuple[str, dict]]:
-            try:
-                url = self.url.replace(self.key_placeholder, api_key)
-                headers = {
-                    k: str(v).replace(self.key_placeholder, api_key)
-                    for k, v in self.headers.items()
-                }
-                response = requests.request(
-                    method=self.method, url=url, headers=headers, timeout=self.timeout
-                )
-                response.raise_for_status()
-                group = self.default_group
-                user_info = None
-                if self.response_as_user_info:
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=256),
+        )
+        # Split the URL / header templates on the placeholder once;
+        # per-call substitution is then a single str.join instead of
+        # scanning every template with str.replace.
+        self._url_parts = self.url.split(self.key_placeholder)
+        self._header_parts = [
+            (k, str(v).split(self.key_placeholder)) for k, v in self.headers.items()
+        ]
+
+        # The configuration is immutable after init, so the checker is built
+        # as a closure over plain locals: per-call slot-descriptor loads
+        # disappear and the unused user-info branch is eliminated up front.
+        client = self._client
+        method = self.method
+        url_parts = self._url_parts
+        header_parts = self._header_parts
+        default_group = self.default_group
+        group_field = self.group_field
+
+        if self.response_as_user_info:
+
+            async def check_func(api_key: str) -> Optional[tuple[str, dict]]:
+                try:
+                    url = api_key.join(url_parts)
+                    headers = {k: api_key.join(parts) for k, parts in header_parts}
+                    response = await client.request(method=method, url=url, headers=headers)
+                    response.raise_for_status()
                     user_info = response.json()
-                    if self.group_field:
-                        group = user_info.get(self.group_field, self.default_group)
-                return group, user_info
-            except requests.exceptions.RequestException:
-                return None
+                    group = (
+                        user_info.get(group_field, default_group)
+                        if group_field
+                        else default_group
+                    )
+                    return group, user_info
+                except httpx.HTTPError:
+                    return None
+
+        else:
+
+            async def check_func(api_key: str) -> Optional[tuple[str, dict]]:
+                try:
+                    url = api_key.join(url_parts)
+                    headers = {k: api_key.join(parts) for k, parts in header_parts}
+                    response = await client.request(method=method, url=url, headers=headers)
+                    response.raise_for_status()
+                    return default_group, None
+                except httpx.HTTPError:
+                    return None
 
         if self.use_cache:
-            try:
-                import cachetools  # pylint: disable=import-outside-toplevel
-            except ImportError as e:
-                raise ImportError(
-                    "Missing optional dependency 'cachetools'. "
-                    "Using 'lm_proxy.api_key_check.CheckAPIKeyWithRequest' with 'use_cache = true' "
-                    "requires installing 'cachetools' package. "
-                    "\nPlease install it with the following command: 'pip install cachetools'"
-                ) from e
-            cache = cachetools.TTLCache(maxsize=self.cache_size, ttl=self.cache_ttl)
-            self._func = cachetools.cached(cache)(check_func)
+            # Hashed keys keep raw API keys out of memory dumps;
+            # negative results are cached too (with a shorter TTL),
+            # so bursts of invalid keys don't hammer the upstream service.
+            cache: dict[bytes, tuple[float, Optional[tuple[str, dict]]]] = {}
+            inflight: dict[bytes, asyncio.Future] = {}
+
+            async def cached_check_func(api_key: str) -> Optional[tuple[str, dict]]:
+                key = hashlib.sha256(api_key.encode("utf-8")).digest()
+                while True:
+                    now = time.monotonic()
+                    if (entry := cache.get(key)) and entry[0] > now:
+                        return entry[1]
+                    if (fut := inflight.get(key)) is not None:
+                        # Concurrent lookups of the same key await a single upstream call
+                        result = await asyncio.shield(fut)
+                        if result is not _RETRY:
+                            return result
+                        # the leading call was cancelled; one of the waiters
+                        # becomes the new leader and re-issues the request
+                        continue
+                    fut = asyncio.get_running_loop().create_future()
+                    inflight[key] = fut
+                    try:
+                        result = await check_func(api_key)
+                    except asyncio.CancelledError:
+                        # cancellation belongs to this request only (e.g. its
+                        # client disconnected): wake waiters to retry instead
+                        # of poisoning the shared future with CancelledError
+                        fut.set_result(_RETRY)
+                        raise
+                    except BaseException as e:
+                        fut.set_exception(e)
+                        fut.exception()  # mark as retrieved for the no-waiters case
+                        raise
+                    finally:
+                        inflight.pop(key, None)
+                    ttl = self.cache_ttl if result else self.negative_ttl
+                    ttl *= 1 + random.uniform(-self.ttl_jitter, self.ttl_jitter)
+                    if len(cache) >= self.cache_size:
+                        for stale in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+                            del cache[stale]
+                        while len(cache) >= self.cache_size:
+                            del cache[next(iter(cache))]
+                    cache[key] = (now + ttl, result)
+                    fut.set_result(result)
+                    return result
+
+            self._func = cached_check_func
         else:
             self._func = check_func
 
-    def __call__(self, api_key: str) -> Optional[tuple[str, dict]]:
-        return self._func(api_key)
+    async def __call__(self, api_key: str) -> Optional[tuple[str, dict]]:
+        return await self._func(api_key)
+
+    async def aclose(self):
+        """Closes the underlying HTTP client and its connection pool."""
+        await self._client.aclose()
@@ -2,20 +2,43 @@
 LM-Proxy Application Entrypoint
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from typing import Optional
 from fastapi import FastAPI
 import typer
 import uvicorn
 
 from .bootstrap import env, bootstrap
-from .core import chat_completions
+from .core import chat_completions, epoch_ticker
 from .models_endpoint import models
 from .errors import OpenAIHTTPException
 
 cli_app = typer.Typer()
 
 
+def uvicorn_impls() -> tuple[str, str]:
+    """
+    Picks the fastest available uvicorn event loop and HTTP protocol implementations.
+    Returns ("uvloop", "httptools") when the optional packages are installed
+    (see the 'performance' package extra), falling back to uvicorn's defaults.
+    """
+    try:
+        import uvloop  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+    try:
+        import httptools  # noqa: F401  pylint: disable=import-outside-toplevel,unused-import
+
+        http = "httptools"
+    except ImportError:
+        http = "auto"
+    return loop, http
+
+
 @cli_app.callback(invoke_without_command=True)
 def run_server(
     config: Optional[str] = typer.Option(None, help="Path to the configuration file"),
@@ -33,6 +56,7 @@ def run_server(
     """
     try:
         bootstrap(config=config or "config.toml", env_file=env_file, debug=debug)
+        loop, http = uvicorn_impls()
         uvicorn.run(
             "lm_proxy.app:web_app",
             host=env.config.host,
@@ -41,6 +65,8 @@ def run_server(
             ssl_certfile=env.config.ssl_certfile or None,
             reload=env.config.dev_autoreload,
             factory=True,
+            loop=loop,
+            http=http,
         )
     except Exception as e:
         if env.debug:
@@ -49,11 +75,28 @@ def run_server(
         raise typer.Exit(code=1)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: runs background maintenance tasks
+    and releases resources held by components on shutdown.
+    """
+    ticker = asyncio.create_task(epoch_ticker())
+    yield
+    ticker.cancel()
+    if aclose := getattr(env.config.api_key_check, "aclose", None):
+        await aclose()
+
+
 def web_app():
     """
     Entrypoint for ASGI server
     """
-    app = FastAPI(title="LM-Proxy", description="OpenAI-compatible proxy server for LLM inference")
+    app = FastAPI(
+        title="LM-Proxy",
+        description="OpenAI-compatible proxy server for LLM inference",
+        lifespan=lifespan,
+    )
     OpenAIHTTPException.register(app)
     app.add_api_route(
         path=f"{env.config.api_prefix}/chat/completions",
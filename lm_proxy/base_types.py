@@ -54,13 +54,13 @@ class ChatCompletionRequest(BaseModel):
     web_search_options: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RequestContext:  # pylint: disable=too-many-instance-attributes
     """
     Stores information about a single LLM request/response cycle for usage in middleware.
     """
 
-    id: Optional[str] = field(default_factory=lambda: str(uuid.uuid4()))
+    id: Optional[str] = field(default_factory=lambda: uuid.uuid4().hex)
     request: Optional[ChatCompletionRequest] = field(default=None)
     http_request: Optional[Request] = field(default=None)
     response: Optional[mc.LLMResponse] = field(default=None)
@@ -77,12 +77,23 @@ class RequestContext:  # pylint: disable=too-many-instance-attributes
     extra: dict = field(default_factory=dict)
 
     def to_dict(self) -> dict:
-        """Export as dictionary."""
-        data = self.__dict__.copy()
-        del data["http_request"]
-        if self.request:
-            data["request"] = self.request.model_dump(mode="json")
-        return data
+        """Export as dictionary (http_request is intentionally omitted)."""
+        return {
+            "id": self.id,
+            "request": self.request.model_dump(mode="json") if self.request else None,
+            "response": self.response,
+            "error": self.error,
+            "group": self.group,
+            "connection": self.connection,
+            "model": self.model,
+            "llm_params": self.llm_params,
+            "api_key_id": self.api_key_id,
+            "remote_addr": self.remote_addr,
+            "created_at": self.created_at,
+            "duration": self.duration,
+            "user_info": self.user_info,
+            "extra": self.extra,
+        }
 
 
 THandler = Callable[[RequestContext], Union[Awaitable[None], None]]
@@ -1,11 +1,14 @@
 """Initialization and bootstrapping."""
 
 import sys
+import hashlib
 import logging
 import inspect
+import secrets
 from os import PathLike
+from types import MappingProxyType
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Mapping, TYPE_CHECKING
 
 import microcore as mc
 from microcore import ui
@@ -51,6 +54,12 @@ class Env:
     components: dict
     loggers: list["TLogger"]
     before: list["THandler"]
+    before_compiled: list[tuple["THandler", bool]]
+    """ before-handlers paired with a precomputed is-async flag for dispatch """
+    api_key_index: Mapping[bytes, str]
+    """ blake2b(api_key) --> group_name mapping precomputed from config.groups """
+    api_key_pepper: bytes
+    """ Per-process random key for hashing API keys in the index """
 
     def _init_components(self):
         self.components = {}
@@ -75,11 +84,27 @@ class Env:
             else:
                 raise ValueError("config must be a path (str or PathLike) or Config instance")
         env.config = config
+        # Keys are stored and compared as fixed-size keyed hashes:
+        # lookups take constant time regardless of key length
+        # and raw keys are kept out of the index.
+        env.api_key_pepper = secrets.token_bytes(16)
+        # read-only proxy: the index is shared across request handlers,
+        # freezing it makes that sharing safe without defensive copies
+        env.api_key_index = MappingProxyType(
+            {
+                hash_api_key(api_key): group_name
+                for group_name, group in config.groups.items()
+                for api_key in group.api_keys
+            }
+        )
 
         env._init_components()
 
         env.loggers = [resolve_instance_or_callable(logger) for logger in env.config.loggers]
         env.before = [resolve_instance_or_callable(handler) for handler in env.config.before]
+        # The handler list is static after bootstrap: resolve each handler's
+        # async-ness once here instead of introspecting results per request.
+        env.before_compiled = [(handler, _is_async_callable(handler)) for handler in env.before]
 
         # initialize connections
         env.connections = {}
@@ -101,6 +126,13 @@ class Env:
 env = Env()
 
 
+def hash_api_key(api_key: str) -> bytes:
+    """Hashes an API key with the per-process pepper for lookups in env.api_key_index."""
+    return hashlib.blake2b(
+        api_key.encode("utf-8"), digest_size=16, key=env.api_key_pepper
+    ).digest()
+
+
 def bootstrap(config: str | Config = "config.toml", env_file: str = ".env", debug=None):
     """Bootstraps the LM-Proxy environment."""
 
@@ -5,10 +5,10 @@ This module defines Pydantic models that match the structure of config.toml.
 
 import os
 from enum import StrEnum
-from typing import Union, Callable, Dict, Optional
+from typing import Awaitable, Union, Callable, Dict, Optional
 from importlib.metadata import entry_points
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 from .utils import resolve_instance_or_callable, replace_env_strings_recursive
 from .loggers import TLogger
@@ -33,17 +33,27 @@ class Group(BaseModel):
 
     api_keys: list[str] = Field(default_factory=list)
     allowed_connections: str = Field(default="*")  # Comma-separated list or "*"
+    _allowed_set: Optional[frozenset] = PrivateAttr(default=None)
+    """ Parsed allowed_connections; None means unrestricted ("*"). """
+
+    def model_post_init(self, __context) -> None:
+        # The list is config-static: parse the comma-separated string once
+        # instead of on every request.
+        if self.allowed_connections != "*":
+            self._allowed_set = frozenset(
+                c.strip() for c in self.allowed_connections.split(",") if c.strip()
+            )
 
     def allows_connecting_to(self, connection_name: str) -> bool:
         """Check if the group allows access to the specified connection."""
-        if self.allowed_connections == "*":
-            return True
-        allowed = [c.strip() for c in self.allowed_connections.split(",") if c.strip()]
-        return connection_name in allowed
+        return self._allowed_set is None or connection_name in self._allowed_set
 
 
 TApiKeyCheckResult = Optional[Union[str, tuple[str, dict]]]
-TApiKeyCheckFunc = Callable[[str | None], TApiKeyCheckResult]
+# validators may be sync or async; core.check awaits awaitable results
+TApiKeyCheckFunc = Callable[
+    [str | None], Union[TApiKeyCheckResult, Awaitable[TApiKeyCheckResult]]
+]
 
 
 class Config(BaseModel):
@@ -0,0 +1,28 @@
+"""Shared memoization for configuration file loaders."""
+
+import functools
+import os
+
+
+def cache_parsed_config(loader):
+    """
+    Memoizes a config loader on (absolute path, mtime_ns, size),
+    so repeated loads of an unchanged file skip parsing entirely.
+    The cached dict is returned as-is (no defensive copy);
+    callers must treat loaded configuration data as read-only.
+    """
+    cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+    @functools.wraps(loader)
+    def wrapper(config_path) -> dict:
+        abs_path = os.path.abspath(os.fspath(config_path))
+        stat = os.stat(abs_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = cache.get(abs_path)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        data = loader(config_path)
+        cache[abs_path] = (stamp, data)
+        return data
+
+    return wrapper
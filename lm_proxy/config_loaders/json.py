@@ -2,7 +2,10 @@
 
 import json
 
+from .cache import cache_parsed_config
 
+
+@cache_parsed_config
 def load_json_config(config_path: str) -> dict:
     """Loads configuration from a JSON file."""
     with open(config_path, "r", encoding="utf-8") as f:
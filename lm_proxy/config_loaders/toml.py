@@ -1,9 +1,21 @@
 """TOML configuration loader."""
 
-import tomllib
+from .cache import cache_parsed_config
 
 
+@cache_parsed_config
 def load_toml_config(config_path: str) -> dict:
     """Loads configuration from a TOML file."""
-    with open(config_path, "rb") as f:
-        return tomllib.load(f)
+    # Parser imports are deferred: this module is imported on every startup
+    # via the config-loader entry points, even when no TOML config is used.
+    try:
+        # C-backed parser, noticeably faster on non-trivial configs
+        import rtoml  # pylint: disable=import-outside-toplevel
+
+        with open(config_path, "r", encoding="utf-8") as f:
+            return rtoml.load(f)
+    except ImportError:
+        import tomllib  # pylint: disable=import-outside-toplevel
+
+        with open(config_path, "rb") as f:
+            return tomllib.load(f)
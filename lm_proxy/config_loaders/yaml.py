@@ -1,6 +1,9 @@
 """YAML configuration loader."""
 
+from .cache import cache_parsed_config
 
+
+@cache_parsed_config
 def load_yaml_config(config_path: str) -> dict:
     """Loads a YAML configuration file and returns its contents as a dictionary."""
     try:
@@ -12,5 +15,11 @@ def load_yaml_config(config_path: str) -> dict:
             "please install it with the following command: 'pip install pyyaml'."
         ) from e
 
+    try:
+        # libyaml-backed loader; safe_load defaults to the pure-Python one
+        from yaml import CSafeLoader as _Loader  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        from yaml import SafeLoader as _Loader  # pylint: disable=import-outside-toplevel
+
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_Loader)
@@ -2,19 +2,29 @@
 
 import asyncio
 import fnmatch
+import functools
 import json
 import logging
+import re
 import secrets
 import time
 import hashlib
 import inspect
+from collections import deque
 from datetime import datetime
 from typing import Optional
 
 from fastapi import HTTPException
 from openai.types.chat.chat_completion import Choice
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.responses import Response, StreamingResponse
+
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as JSONResponse
+except ImportError:
+    orjson = None
+    from starlette.responses import JSONResponse
 
 from .base_types import ChatCompletionRequest, RequestContext
 from .bootstrap import env
@@ -46,6 +56,47 @@ def parse_routing_rule(rule: str, config: Config) -> tuple[str, str]:
     return connection_name, model_part
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_routing(patterns: tuple[str, ...]) -> re.Pattern:
+    """
+    Compiles routing glob patterns into a single alternation regex.
+    Alternatives are ordered as in the routing table, preserving
+    first-match semantics; the index of the matched rule is recovered
+    from the name of the matched group.
+    """
+    return re.compile(
+        "|".join(
+            # fnmatch.translate produces '(?s:...)\\Z'; strip the anchor
+            # so patterns can be joined (fullmatch anchors the whole regex)
+            f"(?P<r{i}>{fnmatch.translate(pattern)[:-2]})"
+            for i, pattern in enumerate(patterns)
+        )
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _routing_table(
+    rules: tuple[tuple[str, str], ...]
+) -> tuple[dict, Optional[re.Pattern], tuple]:
+    """
+    Partitions routing rules into a dict of leading exact model names
+    (typical tables list exact models first and a catch-all last)
+    and the remaining rules compiled into one ordered alternation regex.
+    Exact rules listed after the first wildcard stay in the regex part,
+    so first-match precedence is fully preserved.
+    """
+    exact = {}
+    rest = []
+    for pattern, rule in rules:
+        if rest or any(c in pattern for c in "*?["):
+            rest.append((pattern, rule))
+        else:
+            exact[pattern] = rule
+    rest = tuple(rest)
+    regex = _compile_routing(tuple(p for p, _ in rest)) if rest else None
+    return exact, regex, rest
+
+
 def resolve_connection_and_model(config: Config, external_model: str) -> tuple[str, str]:
     """
     Resolves the connection name and model name based on routing rules.
@@ -53,16 +104,78 @@ def resolve_connection_and_model(config: Config, external_model: str) -> tuple[s
         config (Config): The configuration object containing routing rules.
         external_model (str): The external model name from the request.
     """
-    for model_match, rule in config.routing.items():
-        if fnmatch.fnmatchcase(external_model, model_match):
-            connection_name, model_part = parse_routing_rule(rule, config)
-            resolved_model = external_model if model_part == "*" else model_part
-            return connection_name, resolved_model
-
-    raise ValueError(
-        f"No routing rule matched model '{external_model}'. "
-        'Add a catch-all rule like "*" = "openai.gpt-3.5-turbo" if desired.'
-    )
+    exact, regex, rest = _routing_table(tuple(config.routing.items()))
+    rule = exact.get(external_model)
+    if rule is None and regex and (match := regex.fullmatch(external_model)):
+        rule = rest[int(match.lastgroup[1:])][1]
+    if rule is None:
+        raise ValueError(
+            f"No routing rule matched model '{external_model}'. "
+            'Add a catch-all rule like "*" = "openai.gpt-3.5-turbo" if desired.'
+        )
+    connection_name, model_part = parse_routing_rule(rule, config)
+    resolved_model = external_model if model_part == "*" else model_part
+    return connection_name, resolved_model
+
+
+_LLM_EXCLUDE = frozenset({"messages"})
+""" Request fields excluded from llm_params (the prompt is passed separately). """
+
+_STREAM_DONE = object()
+""" Sentinel queued when the LLM task completes, waking the stream consumer exactly once. """
+
+_NOW_EPOCH = 0
+""" Coarse epoch timestamp refreshed by epoch_ticker(); 0 until the ticker runs. """
+
+
+async def epoch_ticker():
+    """
+    Keeps the cached coarse epoch timestamp fresh (1s granularity).
+    Started from the application lifespan; lets hot paths that only need
+    second precision skip a clock read per request.
+    """
+    global _NOW_EPOCH  # pylint: disable=global-statement
+    while True:
+        _NOW_EPOCH = int(time.time())
+        await asyncio.sleep(1)
+
+
+def now_epoch() -> int:
+    """Returns the cached coarse epoch timestamp, or reads the clock if no ticker runs."""
+    return _NOW_EPOCH or int(time.time())
+
+
+_DONE_CHUNK = b"data: [DONE]\n\n"
+# Constant chunk tails (appended to the per-stream prefix) for the fixed
+# first and last chunks of every stream.
+_ROLE_DELTA_TAIL = b',"choices":[{"index":0,"delta":{"role":"assistant"}}]}\n\n'
+_STOP_TAIL = b',"choices":[{"index":0,"delta":{},"finish_reason":"stop"}]}\n\n'
+_ERROR_TAIL = b',"choices":[{"index":0,"delta":{},"finish_reason":"error"}]}\n\n'
+
+
+def _dumps(obj) -> bytes:
+    """Serializes to JSON bytes, using orjson when installed (see 'performance' extra)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _make_chunk(prefix: bytes, delta=None, content=None, finish_reason=None, error=None) -> bytes:
+    """
+    Renders one SSE chunk: the per-stream invariant prefix
+    plus the serialized variable tail (choices / error).
+    """
+    if delta is None:
+        delta = {"content": str(content)} if content is not None else {}
+    choice = {"index": 0, "delta": delta}
+    if error is not None and finish_reason is None:
+        finish_reason = "error"
+    if finish_reason is not None:
+        choice["finish_reason"] = finish_reason
+    tail = b',"choices":' + _dumps([choice])
+    if error is not None:
+        tail += b',"error":' + _dumps({"message": str(error), "type": type(error).__name__})
+    return prefix + tail + b"}\n\n"
 
 
 async def process_stream(
@@ -74,45 +187,47 @@ async def process_stream(
     Streams the response from the LLM function.
     """
     prompt = request.messages
-    queue = asyncio.Queue()
+    # Single-producer/single-consumer buffer: a plain deque plus one Event
+    # is lighter per token than asyncio.Queue's internal lock and waiters.
+    buffer = deque()
+    wakeup = asyncio.Event()
     stream_id = f"chatcmpl-{secrets.token_hex(12)}"
-    created = int(time.time())
+    created = now_epoch()
+    # The invariant part of every SSE chunk is serialized once per stream;
+    # per-chunk work is reduced to serializing the small variable tail.
+    prefix = (
+        b'data: {"id":"' + stream_id.encode()
+        + b'","object":"chat.completion.chunk","created":' + str(created).encode()
+    )
 
     async def callback(chunk):
-        await queue.put(chunk)
-
-    def make_chunk(delta=None, content=None, finish_reason=None, error=None) -> str:
-        if delta is None:
-            delta = {"content": str(content)} if content is not None else {}
-        obj = {
-            "id": stream_id,
-            "object": "chat.completion.chunk",
-            "created": created,
-            "choices": [{"index": 0, "delta": delta}],
-        }
-        if error is not None:
-            obj["error"] = {"message": str(error), "type": type(error).__name__}
-            if finish_reason is None:
-                finish_reason = "error"
-        if finish_reason is not None:
-            obj["choices"][0]["finish_reason"] = finish_reason
-        return "data: " + json.dumps(obj) + "\n\n"
+        buffer.append(chunk)
+        wakeup.set()
+
+    def on_task_done(_):
+        buffer.append(_STREAM_DONE)
+        wakeup.set()
+
+    make_chunk = functools.partial(_make_chunk, prefix)
 
     task = asyncio.create_task(async_llm_func(prompt, **ctx.llm_params, callback=callback))
+    # The done-callback runs after all produced chunks are already buffered,
+    # so the sentinel is guaranteed to arrive last and no drain pass is needed.
+    task.add_done_callback(on_task_done)
 
     try:
-        yield make_chunk(delta={"role": "assistant"})
-
-        while not task.done():
-            try:
-                block = await asyncio.wait_for(queue.get(), timeout=0.1)
+        yield prefix + _ROLE_DELTA_TAIL
+
+        streaming = True
+        while streaming:
+            await wakeup.wait()
+            # Clear before draining: anything appended afterwards re-sets the event
+            wakeup.clear()
+            while buffer:
+                if (block := buffer.popleft()) is _STREAM_DONE:
+                    streaming = False
+                    break
                 yield make_chunk(content=block)
-            except asyncio.TimeoutError:
-                continue
-
-        while not queue.empty():
-            block = await queue.get()
-            yield make_chunk(content=block)
 
     finally:
         try:
@@ -122,8 +237,8 @@ async def process_stream(
             ctx.error = e
             yield make_chunk(error={"message": str(e), "type": type(e).__name__})
 
-    yield make_chunk(finish_reason="error" if ctx.error else "stop")
-    yield "data: [DONE]\n\n"
+    yield prefix + (_ERROR_TAIL if ctx.error else _STOP_TAIL)
+    yield _DONE_CHUNK
     await log_non_blocking(ctx)
     if ctx.error:
         if env.debug:
@@ -137,18 +252,26 @@ def read_api_key(request: Request) -> str:
     returns '' if not present.
     """
     auth = request.headers.get("authorization")
-    if auth and auth.lower().startswith("bearer "):
+    # lowercase only the scheme prefix, not the whole credential string
+    if auth and auth[:7].lower() == "bearer ":
         return auth[7:].strip()
     return ""
 
 
+@functools.lru_cache(maxsize=4096)
+def _api_key_id(api_key: str, encryption_key: str) -> str:
+    return hashlib.md5((api_key + encryption_key).encode("utf-8")).hexdigest()
+
+
 def api_key_id(api_key: Optional[str]) -> str | None:
     """
     Generates a consistent hashed identifier for the given API key.
+    The digest is deterministic per (key, encryption_key) pair, so repeat
+    requests with the same credentials hit a cache instead of re-hashing.
     """
     if not api_key:
         return None
-    return hashlib.md5((api_key + env.config.encryption_key).encode("utf-8")).hexdigest()
+    return _api_key_id(api_key, env.config.encryption_key)
 
 
 def fail_if_service_disabled():
@@ -181,6 +304,8 @@ async def check(request: Request) -> tuple[str, str, dict]:
     """
     api_key = read_api_key(request)
     result = (env.config.api_key_check)(api_key)
+    if inspect.isawaitable(result):
+        result = await result
     if isinstance(result, tuple):
         group, user_info = result
     else:
@@ -209,7 +334,7 @@ async def chat_completions(request: ChatCompletionRequest, raw_request: Request)
     """
     fail_if_service_disabled()
     group, api_key, user_info = await check(raw_request)
-    llm_params = request.model_dump(exclude={"messages"}, exclude_none=True)
+    llm_params = request.model_dump(exclude=_LLM_EXCLUDE, exclude_none=True)
     connection, llm_params["model"] = resolve_connection_and_model(
         env.config, llm_params.get("model", "default_model")
     )
@@ -244,10 +369,11 @@ async def chat_completions(request: ChatCompletionRequest, raw_request: Request)
             },
         )
 
-    for handler in env.before:
-        result = handler(ctx)
-        if inspect.isawaitable(result):
-            await result
+    for handler, is_async in env.before_compiled:
+        if is_async:
+            await handler(ctx)
+        else:
+            handler(ctx)
 
     async_llm_func = env.connections[connection]
 
@@ -259,7 +385,17 @@ async def chat_completions(request: ChatCompletionRequest, raw_request: Request)
         )
 
     try:
-        out = await async_llm_func(request.messages, **ctx.llm_params)
+        n = ctx.llm_params.get("n") or 1
+        if n > 1:
+            # Fan out sample generation so the n completions overlap at the provider
+            sub_params = {k: v for k, v in ctx.llm_params.items() if k != "n"}
+            outs = await asyncio.gather(
+                *(async_llm_func(request.messages, **sub_params) for _ in range(n))
+            )
+            out = outs[0]
+        else:
+            outs = None
+            out = await async_llm_func(request.messages, **ctx.llm_params)
         ctx.response = out
         logging.info("LLM response: %s", out)
     except Exception as e:
@@ -274,6 +410,22 @@ async def chat_completions(request: ChatCompletionRequest, raw_request: Request)
             code="upstream_error",
         ) from e
     await log_non_blocking(ctx)
+    if outs is not None:
+        choices = []
+        for item in outs:
+            if hasattr(item, "choices") and len(item.choices) > 0 \
+                    and isinstance(item.choices[0], Choice):
+                for c in item.choices:
+                    choices.append({**c.model_dump(mode="json"), "index": len(choices)})
+            else:
+                choices.append(
+                    {
+                        "index": len(choices),
+                        "message": {"role": "assistant", "content": str(item)},
+                        "finish_reason": "stop",
+                    }
+                )
+        return JSONResponse({"choices": choices})
     if hasattr(out, "choices") and len(out.choices) > 0 and isinstance(out.choices[0], Choice):
         return JSONResponse({"choices": [c.model_dump(mode="json") for c in out.choices]})
     return JSONResponse(
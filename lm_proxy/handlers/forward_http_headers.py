@@ -3,10 +3,11 @@ HTTP headers forwarder LM-Proxy.
 """
 
 from dataclasses import dataclass, field
+from typing import Callable
 
 from lm_proxy.base_types import RequestContext
 
-SENSITIVE_HEADERS = {
+SENSITIVE_HEADERS = frozenset({
     # Authentication headers - always use configured credentials
     "authorization",
     "www-authenticate",
@@ -39,13 +40,70 @@ SENSITIVE_HEADERS = {
     ":authority",
     "te",
     "trailer",
-}
+})
 
+SENSITIVE_HEADERS_BYTES = frozenset(h.encode("ascii") for h in SENSITIVE_HEADERS)
+""" Same exclusion set keyed by bytes, for matching raw ASGI header names directly. """
 
-@dataclass
+
+@dataclass(slots=True)
 class HTTPHeadersForwarder:
-    ignore_headers: set[str] = field(default_factory=lambda: frozenset(SENSITIVE_HEADERS))
+    ignore_headers: set[str] = field(default_factory=lambda: SENSITIVE_HEADERS)
     white_list_headers: set[str] = field(default_factory=set)
+    _allowed_bytes: frozenset | None = field(init=False, repr=False)
+    _ignore_bytes: frozenset = field(init=False, repr=False)
+    _ignore_mask: int = field(init=False, repr=False)
+    _filter_into: Callable = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Config may list header names in any case: normalize once here so
+        # per-request comparisons are plain set lookups ("normalize on insert").
+        if self.ignore_headers is not SENSITIVE_HEADERS:
+            self.ignore_headers = frozenset(h.lower() for h in self.ignore_headers)
+        # Raw ASGI header names are lowercase bytes: precompute bytes-keyed
+        # filter sets so the request loop never decodes excluded headers.
+        self._ignore_bytes = (
+            SENSITIVE_HEADERS_BYTES
+            if self.ignore_headers is SENSITIVE_HEADERS
+            else frozenset(h.encode("latin-1") for h in self.ignore_headers)
+        )
+        # Both filter sets are config-static: fold them into one effective
+        # whitelist here so the per-request loop pays a single set probe.
+        self._allowed_bytes = (
+            frozenset(h.lower().encode("latin-1") for h in self.white_list_headers)
+            - self._ignore_bytes
+            if self.white_list_headers
+            else None
+        )
+        # First-byte bitmask prefilter: a header whose first letter matches no
+        # ignored name (e.g. most custom x-* headers) skips the set probe.
+        self._ignore_mask = 0
+        for header in self.ignore_headers:
+            self._ignore_mask |= 1 << (ord(header[0]) & 0x1F)
+
+        # Specialize the filter loop for this configuration: the filter sets
+        # are bound as closure locals and the unused whitelist/ignore branch
+        # is dropped entirely, so per-request iterations skip slot loads
+        # and mode checks.
+        allowed = self._allowed_bytes
+        ignore = self._ignore_bytes
+        ignore_mask = self._ignore_mask
+
+        if allowed is not None:
+
+            def filter_into(raw, out):
+                for name, value in raw:
+                    if name in allowed:
+                        out[name.decode("latin-1")] = value.decode("latin-1")
+
+        else:
+
+            def filter_into(raw, out):
+                for name, value in raw:
+                    if not (ignore_mask >> (name[0] & 0x1F)) & 1 or name not in ignore:
+                        out[name.decode("latin-1")] = value.decode("latin-1")
+
+        self._filter_into = filter_into
 
     async def __call__(self, ctx: RequestContext) -> None:
         """
@@ -53,19 +111,15 @@ class HTTPHeadersForwarder:
         excluding headers in the ignore list.
         If white_list_headers is set, only those headers will be forwarded.
         """
-        if not ctx.http_request or not ctx.http_request.headers:
+        if not ctx.http_request:
             return
-        headers_to_forward = {}
-        for name, value in ctx.http_request.headers.items():
-            name_lower = name.lower()
-            if name_lower in self.ignore_headers:
-                continue
-            if self.white_list_headers and name_lower not in self.white_list_headers:
-                continue
-            headers_to_forward[name] = value
-
-        if not headers_to_forward:
+        raw = ctx.http_request.scope["headers"]
+        if not raw:
             return
-        if "extra_headers" not in ctx.llm_params:
-            ctx.llm_params["extra_headers"] = {}
-        ctx.llm_params["extra_headers"].update(headers_to_forward)
+        # Filter and merge in one pass over the raw (bytes, bytes) pairs:
+        # survivors are decoded and written straight into the destination dict.
+        existing = ctx.llm_params.get("extra_headers")
+        headers_to_forward = {} if existing is None else existing
+        self._filter_into(raw, headers_to_forward)
+        if headers_to_forward and existing is None:
+            ctx.llm_params["extra_headers"] = headers_to_forward
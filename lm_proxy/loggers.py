@@ -1,13 +1,30 @@
 """LLM Request logging."""
 
 import abc
+import atexit
 import json
 import os
 from dataclasses import dataclass, field
-from typing import Union, Callable
+from typing import BinaryIO, Union, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .base_types import RequestContext
-from .utils import CustomJsonEncoder, resolve_instance_or_callable, resolve_obj_path
+from .utils import CustomJsonEncoder, resolve_instance_or_callable, resolve_obj_parts
+
+
+def _json_default(o):
+    """Fallback serializer for orjson mirroring CustomJsonEncoder (datetimes are native)."""
+    if hasattr(o, "model_dump"):
+        return o.model_dump()
+    if hasattr(o, "dict"):
+        return o.dict()
+    if hasattr(o, "__dict__"):
+        return o.__dict__
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
 
 
 class AbstractLogEntryTransformer(abc.ABC):  # pylint: disable=too-few-public-methods
@@ -35,15 +52,15 @@ class LogEntryTransformer(AbstractLogEntryTransformer):  # pylint: disable=too-f
 
     def __init__(self, **kwargs):
         self.mapping = kwargs
+        # The mapping is static per logger: split the dotted paths once here
+        # instead of on every logged request.
+        self._compiled = [(key, path.split(".")) for key, path in kwargs.items()]
 
     def __call__(self, request_context: RequestContext) -> dict:
-        result = {}
-        for key, path in self.mapping.items():
-            result[key] = resolve_obj_path(request_context, path)
-        return result
+        return {key: resolve_obj_parts(request_context, parts) for key, parts in self._compiled}
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseLogger:
     """Base LLM request logger."""
 
@@ -71,23 +88,36 @@ class BaseLogger:
         self.log_writer(self._transform(request_context))
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonLogWriter(AbstractLogWriter):
     """Writes logged data to a JSON file."""
 
     file_name: str
+    _fh: BinaryIO = field(init=False, repr=False)
 
     def __post_init__(self):
         dir_path = os.path.dirname(self.file_name)
         if dir_path:
             os.makedirs(dir_path, exist_ok=True)
-        # Create the file if it doesn't exist
-        with open(self.file_name, "a", encoding="utf-8"):
-            pass
+        # One long-lived append handle instead of open()/close() per record;
+        # flushed after each write so tail readers see records immediately.
+        self._fh = open(self.file_name, "ab")  # pylint: disable=consider-using-with
+        atexit.register(self.close)
 
     def __call__(self, logged_data: dict):
-        with open(self.file_name, "a", encoding="utf-8") as f:
-            f.write(json.dumps(logged_data, cls=CustomJsonEncoder) + "\n")
+        if orjson is not None:
+            self._fh.write(
+                orjson.dumps(logged_data, default=_json_default, option=orjson.OPT_APPEND_NEWLINE)
+            )
+        else:
+            self._fh.write(json.dumps(logged_data, cls=CustomJsonEncoder).encode("utf-8"))
+            self._fh.write(b"\n")
+        self._fh.flush()
+
+    def close(self):
+        """Flushes and closes the underlying log file handle."""
+        if not self._fh.closed:
+            self._fh.close()
 
 
 TLogger = Union[BaseLogger, Callable[[RequestContext], None]]
@@ -3,10 +3,9 @@ Models list endpoint
 """
 
 from starlette.requests import Request
-from starlette.responses import JSONResponse
 
 from .bootstrap import env
-from .core import check, parse_routing_rule, fail_if_service_disabled
+from .core import JSONResponse, check, parse_routing_rule, fail_if_service_disabled
 from .config import ModelListingMode, Group
 
 
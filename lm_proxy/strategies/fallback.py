@@ -51,8 +51,8 @@ class Fallback(BaseModel):
                     f"Fallback connection '{conn_name}' not found. "
                     f"Available: {list(env.connections.keys())}"
                 )
-            kw_args = dict(kwargs)
-            kw_args.update(override_params or {})
+            # single C-level merge; without overrides kwargs is reused as-is
+            kw_args = {**kwargs, **override_params} if override_params else kwargs
             fn: mc.types.LLMAsyncFunctionType = env.connections[conn_name]
             try:
                 return await fn(*args, **kw_args)
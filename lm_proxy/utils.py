@@ -1,9 +1,12 @@
 """Common usage utility functions."""
 
+import functools
+import re
 import os
+import sys
 import json
-import inspect
 import logging
+from collections import deque
 from typing import Any, Callable, Union
 from datetime import datetime, date, time
 
@@ -11,25 +14,57 @@ from microcore.utils import resolve_callable
 from starlette.requests import Request
 
 
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple[str, ...]:
+    return tuple(path.split("."))
+
+
 def resolve_obj_path(obj, path: str, default=None):
     """
     Resolves dotted path supporting
     attributes, dict keys and list indices.
     """
-    for part in path.split("."):
-        try:
-            if isinstance(obj, dict):
-                obj = obj[part]
-            elif isinstance(obj, list):
-                part = int(part)  # Convert to int for list indexing
-                obj = obj[part]
-            else:
-                obj = getattr(obj, part)
-        except (AttributeError, KeyError, TypeError, ValueError, IndexError):
+    return resolve_obj_parts(obj, _split_path(path), default)
+
+
+def resolve_obj_parts(obj, parts, default=None):
+    """
+    Same as resolve_obj_path, but takes the path pre-split into segments
+    so callers with static paths can split once up front.
+    """
+    for part in parts:
+        if isinstance(obj, dict):
+            if (obj := obj.get(part, _MISSING)) is _MISSING:
+                return default
+        elif isinstance(obj, list):
+            try:
+                obj = obj[int(part)]
+            except (ValueError, IndexError):
+                return default
+        elif (obj := getattr(obj, part, _MISSING)) is _MISSING:
             return default
     return obj
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_callable_cached(name: str) -> Callable:
+    """Memoized dotted-path import, so repeated resolutions skip import machinery."""
+    return resolve_callable(name)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_from_spec(class_name: str, args: tuple) -> object:
+    """
+    Memoized construction for fully hashable config specs: the same spec
+    (e.g. re-resolved on config reload) maps to one shared instance instead
+    of a fresh import + construction per call.
+    """
+    return _resolve_callable_cached(class_name)(**dict(args))
+
+
 def resolve_instance_or_callable(
     item: Union[str, Callable, dict, object],
     class_key: str = "class",
@@ -66,59 +101,192 @@ def resolve_instance_or_callable(
     """
     if item is None or item == "":
         return None
-    if isinstance(item, dict):
-        if class_key in item:
-            args = dict(item)
-            class_name = args.pop(class_key)
-            constructor = resolve_callable(class_name)
-            return constructor(**args)
-        elif dict not in (allow_types or []):
+    # normalize once: both checks below take the same tuple, and isinstance
+    # accepts it directly instead of a per-element generator scan
+    allow_types = tuple(allow_types) if allow_types else ()
+    match item:
+        case dict():
+            if class_key in item:
+                args = {**item}
+                class_name = args.pop(class_key)
+                try:
+                    return _build_from_spec(class_name, tuple(sorted(args.items())))
+                except TypeError:
+                    # unhashable kwarg values (nested dicts/lists) - build uncached
+                    constructor = _resolve_callable_cached(class_name)
+                    return constructor(**args)
+            if dict in allow_types:
+                return item
             raise ValueError(
                 f"'{class_key}' key is missing in {debug_name or 'item'} config: {item}"
             )
-    if isinstance(item, str):
-        fn = resolve_callable(item)
-        return fn() if inspect.isclass(fn) else fn
-    if callable(item):
-        return item() if inspect.isclass(item) else item
-    if allow_types and any(isinstance(item, t) for t in allow_types):
-        return item
-    raise ValueError(f"Invalid {debug_name or 'item'} config: {item}")
+        case str():
+            fn = _resolve_callable_cached(item)
+            return fn() if isinstance(fn, type) else fn
+        case _ if callable(item):
+            return item() if isinstance(item, type) else item
+        case _ if allow_types and isinstance(item, allow_types):
+            return item
+        case _:
+            raise ValueError(f"Invalid {debug_name or 'item'} config: {item}")
+
+
+def _json_unserializable(o):
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+_JSON_DISPATCH: dict[type, Callable] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+}
+""" type --> serializer mapping; extended lazily with each new type seen. """
+
+
+def _resolve_json_handler(t: type) -> Callable:
+    for base in t.__mro__:
+        if (handler := _JSON_DISPATCH.get(base)) is not None:
+            return handler
+    if hasattr(t, "model_dump"):
+        return t.model_dump
+    if hasattr(t, "dict"):
+        return t.dict
+    if "__dict__" in dir(t):
+        return vars
+    return _json_unserializable
 
 
 class CustomJsonEncoder(json.JSONEncoder):
     """
     Custom JSON encoder that handles datetime / date / time, pydantic models, etc.
+    Serializers are resolved once per type and cached, so repeated values
+    skip the attribute-probing chain entirely.
     """
 
     def default(self, o):
-        if isinstance(o, (datetime, date, time)):
-            return o.isoformat()
-        if hasattr(o, "model_dump"):
-            return o.model_dump()
-        if hasattr(o, "dict"):
-            return o.dict()
-        if hasattr(o, "__dict__"):
-            return o.__dict__
-        return super().default(o)
+        if (handler := _JSON_DISPATCH.get(type(o))) is None:
+            _JSON_DISPATCH[type(o)] = handler = _resolve_json_handler(type(o))
+        return handler(o)
+
+
+_FORWARDED_FOR_RE = re.compile(rb"for=([^;]*)")
+""" 'for=' element of an RFC 7239 Forwarded header. """
 
 
 def get_client_ip(request: Request) -> str:
     """
     Extract the client's IP address from the request.
     """
-    # Try different headers in order of preference
-    if forwarded_for := request.headers.get("X-Forwarded-For"):
-        return forwarded_for.split(",")[0].strip()
-    if real_ip := request.headers.get("X-Real-IP"):
-        return real_ip
-    if forwarded := request.headers.get("Forwarded"):
+    # Single pass over the raw (bytes, bytes) header list instead of three
+    # case-insensitive Headers lookups; ASGI guarantees lowercase names.
+    forwarded_for = real_ip = forwarded = None
+    for name, value in request.scope["headers"]:
+        if name == b"x-forwarded-for":
+            forwarded_for = value
+            break  # highest priority, nothing later can win
+        if name == b"x-real-ip":
+            real_ip = real_ip or value
+        elif name == b"forwarded":
+            forwarded = forwarded or value
+
+    if forwarded_for:
+        return forwarded_for.split(b",", 1)[0].strip().decode("latin-1")
+    if real_ip:
+        return real_ip.decode("latin-1")
+    if forwarded and (match := _FORWARDED_FOR_RE.search(forwarded)):
         # Parse Forwarded header (RFC 7239)
-        if "for=" in forwarded:
-            return forwarded.split("for=")[1].split(";")[0].strip()
+        return match.group(1).strip().decode("latin-1")
 
     # Fallback to direct client
-    return request.client.host if request.client else "unknown"
+    client = request.scope.get("client")
+    return client[0] if client else "unknown"
+
+
+_ENV_GET = os.environ.get
+""" Bound once: skips the os.environ attribute chain per lookup. load_dotenv
+mutates os.environ in place, so the bound method stays valid. """
+
+_warned_missing: set[str] = set()
+""" Names of missing env variables already warned about (one warning each). """
+
+
+def _reset_warnings():
+    """Clears warn-once state and cached env lookups; used by tests."""
+    _warned_missing.clear()
+    _resolve_env.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_env(env_var_name: str) -> str:
+    """
+    Reads an environment variable, warning once per missing variable.
+    Cached so configs referencing the same variable many times pay a single
+    lookup; call ``_reset_warnings()`` after changing the environment.
+    """
+    value = _ENV_GET(env_var_name)
+    if value is None:
+        # throttled independently of the value cache, so a config with
+        # hundreds of references to one missing variable logs a single record
+        if env_var_name not in _warned_missing:
+            _warned_missing.add(env_var_name)
+            logging.warning("Environment variable '%s' not found", env_var_name)
+        return ""
+    return value
+
+
+_ENV_PREFIX = sys.intern("env:")
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
+
+_ENV_RE = re.compile(r"\benv:([A-Za-z_][A-Za-z0-9_]*)")
+""" An env:NAME reference; NAME is restricted to identifier characters. """
+
+
+class _ResolvedStr(str):
+    """
+    Marks a string produced by env substitution. Compares equal to plain str,
+    but the walker's exact-type dispatch misses it, so re-walking already
+    resolved output (long-running processes re-resolving a config) is free
+    even when the substituted value itself contains 'env:'.
+    """
+
+    __slots__ = ()
+
+
+def _env_match(match: re.Match) -> str:
+    return _resolve_env(match.group(1))
+
+
+def _substitute_env(s: str) -> str:
+    """Replaces every env:NAME reference in a string in one left-to-right pass."""
+    if type(s) is _ResolvedStr:
+        return s
+    # whole-string "env:NAME" is the dominant shape in real configs: the
+    # entire remainder is the variable name (POSIX allows names like MY-VAR
+    # that the embedded-reference regex would split), so slice it out and
+    # look it up directly instead of regexing
+    if s.startswith(_ENV_PREFIX):
+        return _ResolvedStr(_resolve_env(s[_ENV_PREFIX_LEN:]))
+    return _ResolvedStr(_ENV_RE.sub(_env_match, s))
+
+
+def _contains_env_strings(data: Any) -> bool:
+    """Short-circuiting scan for any 'env:' string in a nested dict/list structure."""
+    if isinstance(data, str):
+        return _ENV_PREFIX in data and type(data) is not _ResolvedStr
+    if isinstance(data, dict):
+        return any(_contains_env_strings(v) for v in data.values())
+    if isinstance(data, list):
+        return any(_contains_env_strings(i) for i in data)
+    return False
+
+
+_clean_configs: dict[int, Any] = {}
+""" Top-level configs already scanned and found free of env references,
+keyed by id(). Values are strong references: they pin the scanned object
+alive so its id cannot be recycled for a different one. Cleared wholesale
+at _CLEAN_CONFIGS_LIMIT to bound both memory and pinning. """
+
+_CLEAN_CONFIGS_LIMIT = 64
 
 
 def replace_env_strings_recursive(data: Any) -> Any:
@@ -126,15 +294,79 @@ def replace_env_strings_recursive(data: Any) -> Any:
     Recursively traverses dicts and lists, replacing all string values
     that start with 'env:' with the corresponding environment variable.
     For example, a string "env:VAR_NAME" will be replaced by the value of the
-    environment variable "VAR_NAME".
+    environment variable "VAR_NAME"; references embedded in longer strings
+    ("prefix env:VAR_NAME suffix") are substituted in place as well.
+    Configs without env indirection are returned unchanged without rebuilding.
     """
-    if isinstance(data, dict):
-        return {k: replace_env_strings_recursive(v) for k, v in data.items()}
-    if isinstance(data, list):
-        return [replace_env_strings_recursive(i) for i in data]
-    if isinstance(data, str) and data.startswith("env:"):
-        env_var_name = data[4:]
-        if env_var_name not in os.environ:
-            logging.warning("Environment variable '%s' not found", env_var_name)
-        return os.environ.get(env_var_name, "")
+    if not data:
+        # None, "", empty containers: nothing to substitute, skip all setup
+        return data
+    if isinstance(data, str):
+        # most leaf values are plain strings: one containment test, identity return
+        return _substitute_env(data) if _ENV_PREFIX in data else data
+    if _clean_configs.get(id(data)) is data:
+        return data
+    if not _contains_env_strings(data):
+        if type(data) in (dict, list):
+            # remember clean configs so repeated calls skip the scan entirely
+            if len(_clean_configs) >= _CLEAN_CONFIGS_LIMIT:
+                _clean_configs.clear()
+            _clean_configs[id(data)] = data
+        return data
+    return _replace_env_strings(data)
+
+
+def _walk_str(container, key, value, stack):
+    if _ENV_PREFIX in value:
+        container[key] = _substitute_env(value)
+
+
+def _walk_dict(container, key, value, stack):
+    # structural sharing: subtrees without env refs stay in the result
+    # by identity instead of being copied node by node
+    if _contains_env_strings(value):
+        container[key] = value = {**value}
+        stack.extend((value, k) for k in value)
+
+
+def _walk_list(container, key, value, stack):
+    if _contains_env_strings(value):
+        container[key] = value = list(value)
+        stack.extend((value, i) for i in range(len(value)))
+
+
+_WALK_DISPATCH: dict[type, Callable] = {str: _walk_str, dict: _walk_dict, list: _walk_list}
+""" Exact-type node handlers for the env-substitution walker; config trees
+contain plain builtins, so subclass support is not needed. """
+
+
+def _replace_env_strings(data: Any) -> Any:
+    """
+    Rewrite pass behind replace_env_strings_recursive. Walks the tree with an
+    explicit work stack of (container, key) slots instead of recursing, so
+    deeply nested configs cost no Python frames and cannot hit the recursion
+    limit. Containers are shallow-copied on first visit and substitutions are
+    written into the copies; the caller's structure is never mutated.
+    Node types are dispatched through _WALK_DISPATCH: one dict lookup on
+    type(value) replaces the isinstance chain, which favours the very common
+    string leaves.
+    """
+    t = type(data)
+    if t is str:
+        return _substitute_env(data) if _ENV_PREFIX in data else data
+    if t is dict:
+        data = {**data}
+    elif t is list:
+        data = list(data)
+    else:
+        return data
+    stack = deque((data, key) for key in (data if t is dict else range(len(data))))
+    # LOAD_FAST beats LOAD_GLOBAL in the hot loop: bind the lookups once
+    dispatch = _WALK_DISPATCH.get
+    pop = stack.pop
+    while stack:
+        container, key = pop()
+        value = container[key]
+        if (handler := dispatch(type(value))) is not None:
+            handler(container, key, value, stack)
     return data
@@ -1,4 +1,4 @@
-import requests
+import httpx
 
 from lm_proxy.api_key_check import CheckAPIKeyWithRequest
 
@@ -14,15 +14,14 @@ class _ResponseOk:
         return self._payload
 
 
-def test_check_api_key_with_request_success(monkeypatch):
-    def fake_request(method, url, headers, timeout):
+async def test_check_api_key_with_request_success(monkeypatch):
+    async def fake_request(self, method, url, headers):
         assert method == "post"
         assert url == "https://auth.local/check?key=token-1"
         assert headers["Authorization"] == "Bearer token-1"
-        assert timeout == 3
         return _ResponseOk({"group": "pro", "sub": "u-1"})
 
-    monkeypatch.setattr(requests, "request", fake_request)
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
 
     checker = CheckAPIKeyWithRequest(
         url="https://auth.local/check?key={api_key}",
@@ -34,16 +33,47 @@ def test_check_api_key_with_request_success(monkeypatch):
         default_group="default",
     )
 
-    group, user_info = checker("token-1")
+    group, user_info = await checker("token-1")
     assert group == "pro"
     assert user_info == {"group": "pro", "sub": "u-1"}
 
 
-def test_check_api_key_with_request_returns_none_on_http_error(monkeypatch):
-    def fake_request(*args, **kwargs):
-        raise requests.exceptions.RequestException("boom")
+async def test_check_api_key_with_request_returns_none_on_http_error(monkeypatch):
+    async def fake_request(self, method, url, headers):
+        raise httpx.ConnectError("boom")
 
-    monkeypatch.setattr(requests, "request", fake_request)
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
 
     checker = CheckAPIKeyWithRequest(url="https://auth.local/check?key={api_key}")
-    assert checker("token-2") is None
+    assert await checker("token-2") is None
+
+
+async def test_check_api_key_with_request_cache(monkeypatch):
+    calls = []
+
+    async def fake_request(self, method, url, headers):
+        calls.append(url)
+        if "bad" in url:
+            raise httpx.ConnectError("boom")
+        return _ResponseOk({})
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+
+    checker = CheckAPIKeyWithRequest(url="https://auth.local/check?key={api_key}", use_cache=True)
+
+    # positive results are cached
+    assert await checker("token-1") == ("default", None)
+    assert await checker("token-1") == ("default", None)
+    assert len(calls) == 1
+
+    # negative results are cached too
+    assert await checker("bad-key") is None
+    assert await checker("bad-key") is None
+    assert len(calls) == 2
+
+    # concurrent misses are collapsed into a single upstream call
+    import asyncio
+
+    results = await asyncio.gather(checker("token-2"), checker("token-2"))
+    assert results == [("default", None), ("default", None)]
+    assert len(calls) == 3
@@ -4,28 +4,36 @@ See tests/configs/extra_headers.yml
 """
 
 import json
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from threading import Thread
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
 from tests.conftest import start_proxy, stop_proxy
 
 
+_BODY = json.dumps(
+    {"choices": [{"message": {"role": "assistant", "content": "ok"}}], "model": "test"}
+).encode()
+
+
+CAPTURED = []
+""" Headers of every upstream request the mock received, in order. """
+
+
 class HeaderCapturingHandler(BaseHTTPRequestHandler):
-    captured = {}
 
     def do_POST(self):
-        HeaderCapturingHandler.captured = dict(self.headers)
+        # keep the HTTPMessage as-is: lookups on it are case-insensitive,
+        # and skipping the dict copy keeps the handler allocation-free
+        CAPTURED.append(self.headers)
         self.send_response(200)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_BODY)))
         self.end_headers()
-        self.wfile.write(
-            json.dumps(
-                {"choices": [{"message": {"role": "assistant", "content": "ok"}}], "model": "test"}
-            ).encode()
-        )
+        self.wfile.write(_BODY)
 
     def log_message(self, *_):
         pass
@@ -33,12 +41,18 @@ class HeaderCapturingHandler(BaseHTTPRequestHandler):
 
 @pytest.fixture(scope="session")
 def mock_server():
-    server = HTTPServer(("127.0.0.1", 8131), HeaderCapturingHandler)
+    server = ThreadingHTTPServer(("127.0.0.1", 8131), HeaderCapturingHandler)
     Thread(target=server.serve_forever, daemon=True).start()
-    yield HeaderCapturingHandler
+    yield server
     server.shutdown()
 
 
+@pytest.fixture(autouse=True)
+def reset_captured():
+    """Drops headers captured by a previous test so assertions can't leak across tests."""
+    CAPTURED.clear()
+
+
 @pytest.fixture(scope="session")
 def proxy(mock_server):
     proc = start_proxy("tests/configs/extra_headers.yml", 8132)
@@ -46,42 +60,57 @@ def proxy(mock_server):
     stop_proxy(proc)
 
 
-def test_extra_headers_from_config(proxy, mock_server):
-    response = requests.post(
+@pytest.fixture(scope="session")
+def http():
+    """Shared keep-alive session, so tests reuse one TCP connection to the proxy."""
+    session = requests.Session()
+    session.headers["Authorization"] = "Bearer extra-headers-test"
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+    yield session
+    session.close()
+
+
+_EXPECTED = {
+    "X-Custom-Header": "custom-value",
+    "X-Another-Header": "another-value",
+    "X-Test-Id": "test-123",
+}
+""" Headers from tests/configs/extra_headers.yml the upstream must receive. """
+
+
+def assert_extra_headers(headers):
+    assert _EXPECTED.items() <= dict(headers).items()
+    assert "dummy-key" in headers.get("Authorization", "")
+
+
+def chat(http, **kwargs) -> requests.Response:
+    return http.post(
         "http://127.0.0.1:8132/v1/chat/completions",
         json={"model": "test-model", "messages": [{"role": "user", "content": "test"}]},
-        headers={"Authorization": "Bearer extra-headers-test"},
         timeout=30,
+        **kwargs,
     )
+
+
+def test_extra_headers_from_config(proxy, mock_server, http):
+    response = chat(http)
     assert response.status_code == 200
 
-    h = mock_server.captured
-    assert h["X-Custom-Header"] == "custom-value"
-    assert h["X-Another-Header"] == "another-value"
-    assert h["X-Test-Id"] == "test-123"
-    assert "dummy-key" in h.get("Authorization", "")
+    assert_extra_headers(CAPTURED[-1])
 
 
-def test_extra_headers_forwarder(proxy, mock_server):
-    response = requests.post(
-        "http://127.0.0.1:8132/v1/chat/completions",
-        json={"model": "test-model", "messages": [{"role": "user", "content": "test"}]},
+def test_extra_headers_forwarder(proxy, mock_server, http):
+    response = chat(
+        http,
         headers={
-            "Authorization": "Bearer extra-headers-test",
             "dyn-forwarded-header": "some-value",
             "etag": "should-not-be-forwarded",
         },
-        timeout=30,
     )
     assert response.status_code == 200
 
-    h = mock_server.captured
-    # headers from config
-    assert h["X-Custom-Header"] == "custom-value"
-    assert h["X-Another-Header"] == "another-value"
-    assert h["X-Test-Id"] == "test-123"
-    # auth
-    assert "dummy-key" in h.get("Authorization", "")
+    h = CAPTURED[-1]
+    assert_extra_headers(h)
     # forwarded header
     assert h["dyn-forwarded-header"] == "some-value"
     # not forwarded header
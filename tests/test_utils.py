@@ -6,6 +6,7 @@ import pytest
 from starlette.requests import Request
 
 from lm_proxy.utils import (
+    _reset_warnings,
     resolve_instance_or_callable,
     replace_env_strings_recursive,
     resolve_obj_path,
@@ -45,15 +46,17 @@ def test_resolve_instance_or_callable():
         is resolve_instance_or_callable
     )
 
-    ins = resolve_instance_or_callable(
-        {"class": "lm_proxy.loggers.JsonLogWriter", "file_name": "test.log"}
-    )
+    spec = {"class": "lm_proxy.loggers.JsonLogWriter", "file_name": "test.log"}
+    ins = resolve_instance_or_callable(spec)
     assert ins.__class__.__name__ == "JsonLogWriter" and ins.file_name == "test.log"
+    # the caller's dict must stay intact so config specs can be cached / reused
+    assert spec == {"class": "lm_proxy.loggers.JsonLogWriter", "file_name": "test.log"}
 
 
 def test_replace_env_strings_recursive(caplog):
     os.environ["TEST_VAR1"] = "env_value1"
     os.environ["TEST_VAR2"] = "env_value2"
+    _reset_warnings()
     assert replace_env_strings_recursive("env:TEST_VAR1") == "env_value1"
 
     caplog.set_level(logging.WARNING)